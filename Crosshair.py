@@ -1,98 +1,298 @@
 import sys
 import ctypes
-from PyQt5.QtWidgets import (QApplication, QWidget, QVBoxLayout, QSlider, QLabel, QPushButton, QColorDialog, QFileDialog, QHBoxLayout)
-from PyQt5.QtCore import Qt, QTimer
-from PyQt5.QtGui import QPainter, QColor, QFont, QPixmap
+from contextlib import contextmanager
+from ctypes import wintypes
+from PyQt5.QtWidgets import (QApplication, QWidget, QOpenGLWidget, QVBoxLayout, QSlider, QLabel, QPushButton, QColorDialog, QFileDialog, QHBoxLayout)
+from PyQt5.QtCore import (Qt, QTimer, QRect, QLineF, QRunnable, QThreadPool,
+                          QMetaObject, Q_ARG, pyqtSlot)
+from PyQt5.QtGui import QPainter, QColor, QFont, QPixmap, QPixmapCache, QImage, QImageReader, QPen, QSurfaceFormat, QGuiApplication, QCursor
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
 
 # Constants for making the window click-through
 WS_EX_LAYERED = 0x80000
 WS_EX_TRANSPARENT = 0x20
 GWL_EXSTYLE = -20
 
+# Bind the user32 calls once with declared prototypes so ctypes skips its
+# generic argument-marshalling path on every call.
+_user32 = ctypes.WinDLL("user32", use_last_error=True)
+try:
+    # 64-bit Python needs the *Ptr variants; 32-bit user32 doesn't export them
+    _GetWindowLong = _user32.GetWindowLongPtrW
+    _SetWindowLong = _user32.SetWindowLongPtrW
+except AttributeError:
+    _GetWindowLong = _user32.GetWindowLongW
+    _SetWindowLong = _user32.SetWindowLongW
+_GetWindowLong.argtypes = [wintypes.HWND, ctypes.c_int]
+_GetWindowLong.restype = ctypes.c_ssize_t
+_SetWindowLong.argtypes = [wintypes.HWND, ctypes.c_int, ctypes.c_ssize_t]
+_SetWindowLong.restype = ctypes.c_ssize_t
+
 def make_window_click_through(window_id):
     hwnd = int(window_id)
-    extended_style = ctypes.windll.user32.GetWindowLongW(hwnd, GWL_EXSTYLE)
-    ctypes.windll.user32.SetWindowLongW(hwnd, GWL_EXSTYLE, extended_style | WS_EX_LAYERED | WS_EX_TRANSPARENT)
+    extended_style = _GetWindowLong(hwnd, GWL_EXSTYLE)
+    _SetWindowLong(hwnd, GWL_EXSTYLE, extended_style | WS_EX_LAYERED | WS_EX_TRANSPARENT)
+
+MAX_CUSTOM_CROSSHAIR_SIZE = 256
+
+# Glassmorphism-style sheet for the settings window, applied once at app
+# startup and scoped to #SettingsRoot so only that window is restyled.
+_QSS = """
+    #SettingsRoot {
+        background-color: rgba(255, 255, 255, 0.15);
+        border-radius: 20px;
+    }
+    #SettingsRoot QLabel {
+        color: #FFFFFF;
+        font-size: 18px;
+    }
+    #SettingsRoot QPushButton {
+        background-color: rgba(255, 255, 255, 0.1);
+        color: #FFFFFF;
+        border: 2px solid rgba(255, 255, 255, 0.3);
+        border-radius: 10px;
+        padding: 5px;
+        font-size: 16px;
+    }
+    #SettingsRoot QPushButton:hover {
+        background-color: rgba(255, 255, 255, 0.2);
+    }
+    #SettingsRoot QSlider::groove:horizontal {
+        background: rgba(255, 255, 255, 0.2);
+        height: 8px;
+        border-radius: 4px;
+    }
+    #SettingsRoot QSlider::handle:horizontal {
+        background: #ffffff;
+        border: 1px solid #ffffff;
+        width: 15px;
+        margin: -5px 0; /* half the handle size */
+        border-radius: 7px;
+    }
+"""
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _tint(arr, r, g, b):
+        # Overwrite RGB wherever the pixel is visible, leaving alpha intact
+        for y in prange(arr.shape[0]):
+            for x in range(arr.shape[1]):
+                if arr[y, x, 3] > 0:
+                    arr[y, x, 0] = r
+                    arr[y, x, 1] = g
+                    arr[y, x, 2] = b
+else:
+    def _tint(arr, r, g, b):
+        arr[arr[..., 3] > 0, :3] = (r, g, b)
+
+class _ImageLoadTask(QRunnable):
+    # Decodes a custom crosshair image on a pool thread, scaled down during
+    # decode, and hands the result back to the overlay on the UI thread.
+    def __init__(self, overlay, image_path):
+        super().__init__()
+        self._overlay = overlay
+        self._path = image_path
+
+    def run(self):
+        reader = QImageReader(self._path)
+        size = reader.size()
+        if size.isValid() and (size.width() > MAX_CUSTOM_CROSSHAIR_SIZE
+                               or size.height() > MAX_CUSTOM_CROSSHAIR_SIZE):
+            size.scale(MAX_CUSTOM_CROSSHAIR_SIZE, MAX_CUSTOM_CROSSHAIR_SIZE, Qt.KeepAspectRatio)
+            reader.setScaledSize(size)
+        image = reader.read()
+        if image.isNull():
+            return
+        # QPixmap is GUI-thread-only, so deliver the QImage via a queued call
+        QMetaObject.invokeMethod(self._overlay, "_set_custom_image",
+                                 Qt.QueuedConnection, Q_ARG(QImage, image))
 
-class CrosshairOverlay(QWidget):
+# QOpenGLWidget keeps the tiny overlay on the GPU composition path instead
+# of Qt's software raster engine.
+class CrosshairOverlay(QOpenGLWidget):
     def __init__(self):
         super().__init__()
         self.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint | Qt.Tool)
         self.setAttribute(Qt.WA_TranslucentBackground)
         self.setAttribute(Qt.WA_NoSystemBackground)
-        self.setGeometry(0, 0, QApplication.desktop().width(), QApplication.desktop().height())
+
+        # The window is kept just large enough for the crosshair and centered
+        # on the screen, so the compositor only blends a few hundred pixels
+        # instead of the whole desktop. Query the screen geometry once via
+        # QScreen (the screen under the cursor, for multi-monitor setups)
+        # rather than the deprecated QDesktopWidget.
+        screen = QGuiApplication.screenAt(QCursor.pos()) or QGuiApplication.primaryScreen()
+        self._screen_rect = screen.geometry()
 
         self.crosshair_visible = False
         self.default_size = 15
         self.default_thickness = 2
         self.default_color = QColor(255, 0, 0, 255)
+        self._cached_pixmap = None
+        self._crosshair_rect = QRect()
         self.reset_to_default()
 
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_overlay)
-        self.timer.start(16)  # 60 FPS
-
-        self.show()
+        # winId() forces native window creation, so the click-through style
+        # can be applied before the overlay is ever shown.
         make_window_click_through(self.winId())
 
     def reset_to_default(self):
-        self.size = self.default_size
-        self.thickness = self.default_thickness
-        self.color = self.default_color
-        self.crosshair_image = None
-        self.update()
-
-    def update_overlay(self):
-        if self.crosshair_visible:
-            self.show()
+        with self._batch_update():
+            self.size = self.default_size
+            self.thickness = self.default_thickness
+            self.color = self.default_color
+            self.crosshair_image = None
+            self._rebuild_pen()
+            self._rebuild_cache()
+
+    @contextmanager
+    def _batch_update(self):
+        # Suppress repaints while several properties change, then issue a
+        # single update covering the old and new crosshair areas
+        old_rect = self._crosshair_rect
+        self.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            self.setUpdatesEnabled(True)
+            self.update(self._crosshair_rect.united(old_rect))
+
+    def _rebuild_pen(self):
+        # The pen only changes with color/thickness, so build it once there
+        self._pen = QPen(self.color)
+        self._pen.setWidth(self.thickness)
+
+    def _rebuild_cache(self):
+        # Look the style up in the process-wide QPixmapCache first, so
+        # overlays (or repeated style switches) share one rasterization.
+        key = f"xh:{self.size}:{self.thickness}:{self.color.rgba()}"
+        pixmap = QPixmap()
+        if not QPixmapCache.find(key, pixmap):
+            w = 2 * self.size + self.thickness
+            pixmap = QPixmap(w, w)
+            pixmap.fill(Qt.transparent)
+
+            painter = QPainter(pixmap)
+            painter.setPen(self._pen)
+
+            mid = w // 2
+            lines = [
+                QLineF(mid - self.size, mid, mid + self.size, mid),
+                QLineF(mid, mid - self.size, mid, mid + self.size),
+            ]
+            painter.drawLines(lines)
+            painter.end()
+
+            QPixmapCache.insert(key, pixmap)
+
+        self._cached_pixmap = pixmap
+        self._update_crosshair_rect()
+
+    def _update_crosshair_rect(self):
+        # Resize the window to just fit the current crosshair and keep it
+        # centered on the screen; the bounding rect then covers the widget.
+        if self.crosshair_image:
+            w = self.crosshair_image.width()
+            h = self.crosshair_image.height()
         else:
-            self.hide()
+            w = h = self._cached_pixmap.width()
+        # (screen_w - w) // 2 keeps the crosshair on the true screen center;
+        # QRect.center() rounds down and would land even sizes 1px up-left.
+        self.setGeometry(self._screen_rect.x() + (self._screen_rect.width() - w) // 2,
+                         self._screen_rect.y() + (self._screen_rect.height() - h) // 2, w, h)
+        self._crosshair_rect = self.rect()
 
     def toggle_crosshair(self, visible):
         self.crosshair_visible = visible
+        if visible:
+            self.show()
+        else:
+            self.hide()
 
     def set_size(self, size):
         self.size = size
-        self.update()
+        old_rect = self._crosshair_rect
+        self._rebuild_cache()
+        self.update(self._crosshair_rect.united(old_rect))
 
     def set_thickness(self, thickness):
         self.thickness = thickness
-        self.update()
+        old_rect = self._crosshair_rect
+        self._rebuild_pen()
+        self._rebuild_cache()
+        self.update(self._crosshair_rect.united(old_rect))
 
     def set_color(self, color):
         self.color = color
-        self.update()
+        old_rect = self._crosshair_rect
+        self._rebuild_pen()
+        self._rebuild_cache()
+        self.update(self._crosshair_rect.united(old_rect))
 
     def load_custom_crosshair(self, image_path):
-        self.crosshair_image = QPixmap(image_path)
-        self.update()
+        # Decode off the UI thread; a large PNG would otherwise block the
+        # event loop for the duration of the decode
+        QThreadPool.globalInstance().start(_ImageLoadTask(self, image_path))
+
+    @pyqtSlot(QImage)
+    def _set_custom_image(self, image):
+        self.crosshair_image = QPixmap.fromImage(image)
+        old_rect = self._crosshair_rect
+        self._update_crosshair_rect()
+        self.update(self._crosshair_rect.united(old_rect))
+
+    def recolor_custom(self, target_color):
+        # Tint the custom crosshair in one vectorized (or JIT-compiled) pass
+        # over a writable ndarray view of the image, never per-pixel Python
+        if self.crosshair_image is None or np is None:
+            return
+        img = self.crosshair_image.toImage().convertToFormat(QImage.Format_RGBA8888)
+        ptr = img.bits()
+        ptr.setsize(img.byteCount())
+        arr = np.frombuffer(ptr, dtype=np.uint8).reshape(img.height(), img.width(), 4)
+        _tint(arr, target_color.red(), target_color.green(), target_color.blue())
+        self.crosshair_image = QPixmap.fromImage(img)
+        self.update(self._crosshair_rect)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._update_crosshair_rect()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        # Creating the OpenGL surface can replace the native window, so
+        # make sure the layered click-through styles are still applied
+        make_window_click_through(self.winId())
 
     def paintEvent(self, event):
         if not self.crosshair_visible:
             return
 
+        # Skip paints for screen regions the crosshair doesn't touch
+        if not event.region().intersects(self._crosshair_rect):
+            return
+
         painter = QPainter(self)
 
         if self.crosshair_image:
-            # Draw custom crosshair image
-            image_rect = self.crosshair_image.rect()
-            image_rect.moveCenter(self.rect().center())
-            painter.drawPixmap(image_rect, self.crosshair_image)
+            # Draw custom crosshair image at its precomputed position
+            painter.drawPixmap(self._crosshair_rect.topLeft(), self.crosshair_image)
         else:
-            # Draw default crosshair
-            painter.setPen(self.color)
-            mid_x = self.width() // 2
-            mid_y = self.height() // 2
-
-            pen = painter.pen()
-            pen.setWidth(self.thickness)
-            painter.setPen(pen)
-
-            # Draw horizontal line
-            painter.drawLine(mid_x - self.size, mid_y, mid_x + self.size, mid_y)
-
-            # Draw vertical line
-            painter.drawLine(mid_x, mid_y - self.size, mid_x, mid_y + self.size)
+            # Blit the pre-rendered default crosshair. A fully opaque color
+            # can be written straight to the destination instead of going
+            # through SourceOver's per-pixel read-modify-write.
+            if self.color.alpha() == 255:
+                painter.setCompositionMode(QPainter.CompositionMode_Source)
+            painter.drawPixmap(self._crosshair_rect.topLeft(), self._cached_pixmap)
 
         painter.end()
 
@@ -100,54 +300,25 @@ class CrosshairSettingsUI(QWidget):
     def __init__(self, crosshair_overlay):
         super().__init__()
         self.crosshair_overlay = crosshair_overlay
+        self._size_pending = False
+        self._thickness_pending = False
+        self._color_pending = False
         self.init_ui()
 
     def init_ui(self):
         self.setWindowTitle("Crosshair Settings")
         self.setGeometry(100, 100, 400, 450)  # Increased height for additional slider
 
-        # Glassmorphism effect with rounded corners
-        self.setStyleSheet("""
-            QWidget {
-                background-color: rgba(255, 255, 255, 0.15);
-                border-radius: 20px;
-                backdrop-filter: blur(15px);
-                padding: 15px;
-            }
-            QLabel {
-                color: #FFFFFF;
-                font-size: 18px;
-            }
-            QPushButton {
-                background-color: rgba(255, 255, 255, 0.1);
-                color: #FFFFFF;
-                border: 2px solid rgba(255, 255, 255, 0.3);
-                border-radius: 10px;
-                padding: 5px;
-                font-size: 16px;
-            }
-            QPushButton:hover {
-                background-color: rgba(255, 255, 255, 0.2);
-            }
-            QSlider::groove:horizontal {
-                background: rgba(255, 255, 255, 0.2);
-                height: 8px;
-                border-radius: 4px;
-            }
-            QSlider::handle:horizontal {
-                background: #ffffff;
-                border: 1px solid #ffffff;
-                width: 15px;
-                margin: -5px 0; /* half the handle size */
-                border-radius: 7px;
-            }
-        """)
+        # Styling lives in the module-level _QSS sheet, applied once in
+        # main(); this window just opts in via its object name.
+        self.setObjectName("SettingsRoot")
 
         # Custom fonts
         font = QFont("Arial", 14)
 
         # Layout setup
         layout = QVBoxLayout()
+        layout.setContentsMargins(15, 15, 15, 15)
 
         # Crosshair size slider
         self.size_label = QLabel(f"Crosshair Size: {self.crosshair_overlay.size}")
@@ -221,19 +392,61 @@ class CrosshairSettingsUI(QWidget):
         self.setLayout(layout)
 
     def update_size(self, value):
+        # Update the label immediately but coalesce overlay repaints, so a
+        # fast slider drag causes one repaint per frame instead of one per value
         self.size_label.setText(f"Crosshair Size: {value}")
-        self.crosshair_overlay.set_size(value)
+        self._pending_size = value
+        if not self._size_pending:
+            self._size_pending = True
+            QTimer.singleShot(16, self._flush_size)
+
+    def _flush_size(self):
+        self._size_pending = False
+        self.crosshair_overlay.set_size(self._pending_size)
 
     def update_thickness(self, value):
         self.thickness_label.setText(f"Crosshair Thickness: {value}")
-        self.crosshair_overlay.set_thickness(value)
+        self._pending_thickness = value
+        if not self._thickness_pending:
+            self._thickness_pending = True
+            QTimer.singleShot(16, self._flush_thickness)
+
+    def _flush_thickness(self):
+        self._thickness_pending = False
+        self.crosshair_overlay.set_thickness(self._pending_thickness)
 
     def update_fov(self, value):
         self.fov_label.setText(f"Field of View (FOV): {value}")
         # Implement logic to handle FOV adjustment for the game here
 
     def choose_color(self):
-        color = QColorDialog.getColor()
+        # Non-modal dialog so the UI stays responsive and the overlay
+        # previews the color live, debounced like the sliders
+        original = self.crosshair_overlay.color
+        dlg = QColorDialog(original, self)
+        dlg.setAttribute(Qt.WA_DeleteOnClose)
+        dlg.currentColorChanged.connect(self._preview_color)
+        dlg.colorSelected.connect(self._commit_color)
+        dlg.rejected.connect(lambda: self._restore_color(original))
+        dlg.open()
+
+    def _restore_color(self, original):
+        # Point any still-pending debounce flush at the original color so a
+        # late _flush_color can't re-apply the abandoned preview
+        self._pending_color = original
+        self.crosshair_overlay.set_color(original)
+
+    def _preview_color(self, color):
+        self._pending_color = color
+        if not self._color_pending:
+            self._color_pending = True
+            QTimer.singleShot(16, self._flush_color)
+
+    def _flush_color(self):
+        self._color_pending = False
+        self.crosshair_overlay.set_color(self._pending_color)
+
+    def _commit_color(self, color):
         if color.isValid():
             self.crosshair_overlay.set_color(color)
 
@@ -255,7 +468,15 @@ class CrosshairSettingsUI(QWidget):
             self.crosshair_overlay.toggle_crosshair(False)
 
 def main():
+    # Request an alpha-capable, vsynced surface before any window exists
+    fmt = QSurfaceFormat()
+    fmt.setAlphaBufferSize(8)
+    fmt.setSwapInterval(1)
+    QSurfaceFormat.setDefaultFormat(fmt)
+
     app = QApplication(sys.argv)
+    app.setStyleSheet(_QSS)
+    QPixmapCache.setCacheLimit(10240)  # KB
 
     # Create the crosshair overlay (invisible initially)
     overlay = CrosshairOverlay()